@@ -1,9 +1,15 @@
 import streamlit as st
 import PyPDF2
 import openai
-from typing import List, Dict
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
+import logging
+import re
 import time
 
+logger = logging.getLogger(__name__)
+
 # Configure the page
 st.set_page_config(
     page_title="GenAI Document Assistant",
@@ -18,6 +24,8 @@ if 'document_name' not in st.session_state:
     st.session_state.document_name = ""
 if 'summary' not in st.session_state:
     st.session_state.summary = ""
+if 'summary_status' not in st.session_state:
+    st.session_state.summary_status = ""  # "pending", "ai" or "fallback"
 if 'mode' not in st.session_state:
     st.session_state.mode = None
 if 'questions' not in st.session_state:
@@ -28,6 +36,16 @@ if 'quiz_state' not in st.session_state:
     st.session_state.quiz_state = "ready"
 if 'chat_history' not in st.session_state:
     st.session_state.chat_history = []
+if 'history_pages' not in st.session_state:
+    st.session_state.history_pages = 1
+
+# Number of conversation turns rendered per page of history
+HISTORY_PAGE_SIZE = 10
+
+# Per-attempt API timeout for the background AI summary, and how long the local
+# preview waits for it (covering one retry) before becoming the final summary
+SUMMARY_TIMEOUT_SECONDS = 20
+SUMMARY_DEADLINE_SECONDS = 45
 
 class DocumentProcessor:
     """Handles document processing and text extraction"""
@@ -62,6 +80,70 @@ class DocumentProcessor:
             st.error(f"Error reading text file: {str(e)}")
             return ""
 
+class ExtractiveSummarizer:
+    """Builds instant local summaries using TextRank over TF-IDF sentence vectors"""
+    
+    MAX_SENTENCES = 300  # cap the similarity graph so summaries stay in the millisecond range
+    
+    @staticmethod
+    def split_sentences(content: str) -> List[str]:
+        """Split text into sentences, dropping fragments too short to summarize"""
+        text = re.sub(r'\s+', ' ', content)
+        sentences = re.split(r'(?<=[.!?])\s+', text)
+        return [s.strip() for s in sentences if len(s.split()) >= 4]
+    
+    @staticmethod
+    def summarize(content: str, max_words: int = 150) -> str:
+        """Return the highest ranked sentences, in document order, within max_words"""
+        sentences = ExtractiveSummarizer.split_sentences(content)
+        if len(sentences) > ExtractiveSummarizer.MAX_SENTENCES:
+            # Sample evenly so long documents are represented end to end
+            picks = np.linspace(0, len(sentences) - 1, ExtractiveSummarizer.MAX_SENTENCES).astype(int)
+            sentences = [sentences[i] for i in picks]
+        if not sentences:
+            return " ".join(content.split()[:max_words])
+        
+        # TF-IDF sentence vectors
+        tokens = [re.findall(r'[a-z0-9]+', s.lower()) for s in sentences]
+        vocab = {}
+        for words in tokens:
+            for word in words:
+                vocab.setdefault(word, len(vocab))
+        tf = np.zeros((len(sentences), max(len(vocab), 1)))
+        for row, words in enumerate(tokens):
+            for word in words:
+                tf[row, vocab[word]] += 1
+        idf = np.log(len(sentences) / (1 + (tf > 0).sum(axis=0))) + 1
+        vectors = tf * idf
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.where(norms == 0, 1, norms)
+        
+        # TextRank: PageRank over the cosine similarity graph
+        similarity = vectors @ vectors.T
+        np.fill_diagonal(similarity, 0)
+        row_sums = similarity.sum(axis=1, keepdims=True)
+        transition = np.where(row_sums == 0, 1 / len(sentences), similarity / np.where(row_sums == 0, 1, row_sums))
+        damping = 0.85
+        scores = np.full(len(sentences), 1 / len(sentences))
+        for _ in range(50):
+            updated = (1 - damping) / len(sentences) + damping * transition.T @ scores
+            if np.abs(updated - scores).sum() < 1e-6:
+                scores = updated
+                break
+            scores = updated
+        
+        # Greedily take top sentences that fit the word budget
+        selected, word_count = [], 0
+        for idx in np.argsort(-scores):
+            length = len(sentences[idx].split())
+            if word_count + length <= max_words:
+                selected.append(idx)
+                word_count += length
+        if not selected:
+            return " ".join(sentences[int(np.argmax(scores))].split()[:max_words])
+        
+        return " ".join(sentences[i] for i in sorted(selected))
+
 class AIAssistant:
     """Handles AI interactions using OpenAI API"""
     
@@ -70,10 +152,12 @@ class AIAssistant:
         self.client = openai.OpenAI(api_key=api_key)
         self.model_name = model_name
     
-    def generate_summary(self, content: str) -> str:
-        """Generate a concise summary of the document (under 150 words)"""
+    def generate_summary(self, content: str) -> Optional[str]:
+        """Generate a concise summary of the document (under 150 words), or None if the API call fails"""
         try:
-            response = self.client.chat.completions.create(
+            response = self.client.with_options(
+                timeout=SUMMARY_TIMEOUT_SECONDS, max_retries=1
+            ).chat.completions.create(
                 model=self.model_name,
                 messages=[
                     {
@@ -90,7 +174,8 @@ class AIAssistant:
             )
             return response.choices[0].message.content.strip()
         except Exception as e:
-            return f"Error generating summary: {str(e)}"
+            logger.warning("Error generating summary: %s", e, exc_info=True)
+            return None
     
     def answer_question(self, question: str, document_content: str) -> str:
         """Answer questions based strictly on document content"""
@@ -220,11 +305,66 @@ EVALUATION: [Detailed feedback with specific justifications from the document, e
 def reset_session():
     """Reset all session state variables"""
     keys_to_reset = ['document_content', 'document_name', 'summary', 'mode', 
-                     'questions', 'current_question_index', 'quiz_state', 'chat_history']
+                     'questions', 'current_question_index', 'quiz_state', 'chat_history',
+                     'history_pages', 'summary_status', 'summary_future', 'summary_deadline']
     for key in keys_to_reset:
         if key in st.session_state:
             del st.session_state[key]
 
+@st.cache_resource
+def get_summary_executor() -> ThreadPoolExecutor:
+    """Shared worker pool for background AI summary requests"""
+    return ThreadPoolExecutor(max_workers=4)
+
+@st.fragment(run_every=1)
+def render_pending_summary():
+    """Show the local extractive summary, swapping in the AI summary once it arrives"""
+    future = st.session_state.get('summary_future')
+    timed_out = time.time() > st.session_state.get('summary_deadline', 0)
+    if future is None or future.done() or timed_out:
+        ai_summary = future.result() if future is not None and future.done() else None
+        if ai_summary:
+            st.session_state.summary = ai_summary
+            st.session_state.summary_status = "ai"
+        else:
+            if future is not None and not future.done():
+                logger.warning("AI summary not ready after %s seconds, keeping local summary", SUMMARY_DEADLINE_SECONDS)
+                future.cancel()
+            st.session_state.summary_status = "fallback"
+        st.session_state.pop('summary_future', None)
+        st.session_state.pop('summary_deadline', None)
+        st.rerun()
+    
+    st.info(st.session_state.summary)
+    st.caption("⏳ Quick local preview — the AI summary will replace it shortly.")
+
+def show_older_history():
+    """Page one more block of older conversation turns into view"""
+    st.session_state.history_pages += 1
+
+@st.fragment
+def render_conversation_history():
+    """Render the newest conversation turns, paging older ones in on demand.
+
+    Runs as a fragment so paging only reruns this block, and only the visible
+    pages are rendered so rerun cost does not grow with the session length.
+    """
+    history = st.session_state.chat_history
+    visible = st.session_state.history_pages * HISTORY_PAGE_SIZE
+    
+    for i, chat in enumerate(reversed(history[-visible:])):
+        with st.expander(
+            f"Q: {chat['question'][:80]}..." if len(chat['question']) > 80 
+            else f"Q: {chat['question']}", 
+            expanded=(i == 0)
+        ):
+            st.markdown(f"**Question:** {chat['question']}")
+            st.markdown(f"**Answer:** {chat['answer']}")
+    
+    hidden = len(history) - visible
+    if hidden > 0:
+        st.button(f"⬇️ Show older questions ({hidden} more)", on_click=show_older_history)
+
 def main():
     """Main application function"""
     
@@ -306,10 +446,13 @@ def main():
                 st.session_state.document_content = content
                 st.session_state.document_name = uploaded_file.name
                 
-                # Generate summary
-                with st.spinner("🤖 Generating AI summary..."):
-                    summary = ai_assistant.generate_summary(content)
-                    st.session_state.summary = summary
+                # Show an instant local summary while the AI summary is generated in the background
+                st.session_state.summary = ExtractiveSummarizer.summarize(content)
+                st.session_state.summary_status = "pending"
+                st.session_state.summary_deadline = time.time() + SUMMARY_DEADLINE_SECONDS
+                st.session_state.summary_future = get_summary_executor().submit(
+                    ai_assistant.generate_summary, content
+                )
                 
                 st.success(f"✅ Successfully processed: {uploaded_file.name}")
                 st.rerun()
@@ -317,7 +460,12 @@ def main():
     else:
         # Document summary section
         st.header("📋 Document Summary")
-        st.info(st.session_state.summary)
+        if st.session_state.summary_status == "pending":
+            render_pending_summary()
+        else:
+            st.info(st.session_state.summary)
+            if st.session_state.summary_status == "fallback":
+                st.caption("⚠️ AI summary unavailable — showing a local extractive summary.")
         
         # Mode selection
         if not st.session_state.mode:
@@ -360,6 +508,8 @@ def main():
                             "answer": answer,
                             "timestamp": time.time()
                         })
+                        # Collapse back to the newest page so reruns stay bounded
+                        st.session_state.history_pages = 1
                         st.rerun()
             
             with col2:
@@ -370,15 +520,7 @@ def main():
             # Display conversation history
             if st.session_state.chat_history:
                 st.subheader("💭 Conversation History")
-                
-                for i, chat in enumerate(reversed(st.session_state.chat_history)):
-                    with st.expander(
-                        f"Q: {chat['question'][:80]}..." if len(chat['question']) > 80 
-                        else f"Q: {chat['question']}", 
-                        expanded=(i == 0)
-                    ):
-                        st.markdown(f"**Question:** {chat['question']}")
-                        st.markdown(f"**Answer:** {chat['answer']}")
+                render_conversation_history()
         
         # Challenge Me Mode
         elif st.session_state.mode == "challenge_me":
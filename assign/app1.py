@@ -24,6 +24,33 @@ if "challenge_questions" not in st.session_state:
     st.session_state.challenge_questions = None
 if "challenge_results" not in st.session_state:
     st.session_state.challenge_results = None
+if "history_pages" not in st.session_state:
+    st.session_state.history_pages = 1
+
+# Number of chat messages rendered per page of history
+HISTORY_PAGE_SIZE = 20
+
+
+# --- Conversation Rendering ---
+def show_older_history():
+    st.session_state.history_pages += 1
+
+@st.fragment
+def render_chat_history():
+    """Render the newest chat messages as a fragment, paging older ones in on demand."""
+    history = st.session_state.chat_history
+    visible = st.session_state.history_pages * HISTORY_PAGE_SIZE
+
+    hidden = len(history) - visible
+    if hidden > 0:
+        st.button(f"Show older messages ({hidden} more)", on_click=show_older_history)
+
+    for message in history[-visible:]:
+        with st.chat_message(message["role"]):
+            st.markdown(message["content"])
+            if "source" in message:
+                with st.expander("View Source Snippet"):
+                    st.info(message["source"])
 
 
 # --- UI Rendering ---
@@ -51,6 +78,7 @@ with st.sidebar:
                 st.session_state.challenge_questions = None
                 st.session_state.challenge_results = None
                 st.session_state.chat_history = [] # Reset chat history
+                st.session_state.history_pages = 1
 
                 st.success("Document processed successfully!")
                 st.rerun() # Rerun to update the main page view
@@ -71,18 +99,14 @@ else:
         st.header("Ask Anything")
         st.write("Ask free-form questions about the document.")
 
-        # Display existing chat messages
-        for message in st.session_state.chat_history:
-            with st.chat_message(message["role"]):
-                st.markdown(message["content"])
-                if "source" in message:
-                    with st.expander("View Source Snippet"):
-                        st.info(message["source"])
+        # Display existing chat messages (newest page only)
+        render_chat_history()
 
         # Chat input for new questions
         if user_question := st.chat_input("What would you like to ask?"):
             # Add user message to history
             st.session_state.chat_history.append({"role": "user", "content": user_question})
+            st.session_state.history_pages = 1 # Collapse back to the newest page of history
             with st.chat_message("user"):
                 st.markdown(user_question)
 
@@ -102,12 +126,7 @@ else:
                     "content": answer,
                     "source": source_snippet
                 })
-
-                # Display assistant's response
-                with st.chat_message("assistant"):
-                    st.markdown(answer)
-                    with st.expander("View Source Snippet"):
-                        st.info(source_snippet)
+                st.rerun() # Redraw the new turn through render_chat_history only
 
     # --- "Challenge Me" Mode ---
     with tab2:
@@ -0,0 +1,75 @@
+"""
+Recall-vs-memory benchmark for the quantized FAISS index types
+"""
+import argparse
+import os
+
+from core import (
+    PQ_MIN_RELIABLE_TRAINING,
+    PQ_NBITS,
+    benchmark_index_types,
+    load_document_text,
+    split_text
+)
+
+DOCUMENT_EXTENSIONS = (".pdf", ".txt")
+
+def collect_documents(paths):
+    """Expand files and directories into a sorted list of PDF/TXT document paths"""
+    documents = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                documents.extend(
+                    os.path.join(root, name) for name in files
+                    if name.lower().endswith(DOCUMENT_EXTENSIONS)
+                )
+        else:
+            documents.append(path)
+    return sorted(documents)
+
+def main():
+    """Benchmark flat, int8 scalar-quantized and product-quantized indexes on a corpus"""
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("paths", nargs="+", help="PDF/TXT files or directories of them")
+    parser.add_argument("--k", type=int, default=4, help="neighbours per query for recall@k")
+    args = parser.parse_args()
+
+    chunks = []
+    documents = collect_documents(args.paths)
+    for path in documents:
+        with open(path, "rb") as document:
+            chunks.extend(split_text(load_document_text(document)))
+    print(f"📄 {len(documents)} documents: {len(chunks)} chunks, recall@{args.k} on held-out chunks vs the flat index")
+    print("\n" + "="*50)
+
+    results = benchmark_index_types(chunks, k=args.k)
+    print(f"{'index':<8}{'recall':>10}{'bytes/vec':>12}{'compression':>14}{'query ms':>12}")
+    skipped = []
+    for row in results:
+        if row["effective_index_type"] != row["index_type"]:
+            skipped.append(row)
+            continue
+        print(
+            f"{row['index_type']:<8}"
+            f"{row['recall_at_k']:>10.3f}"
+            f"{row['bytes_per_vector']:>12.1f}"
+            f"{row['compression']:>13.1f}x"
+            f"{row['query_ms']:>12.3f}"
+            f"{'' if row['reliable'] else '  *'}"
+        )
+
+    for row in skipped:
+        print(
+            f"\n⚠️ Skipped '{row['index_type']}': it needs at least {2 ** PQ_NBITS} chunks to train "
+            f"and the corpus leaves {row['train_vectors']}, so it would fall back to '{row['effective_index_type']}'. "
+            f"Pass more documents or a directory."
+        )
+    if not all(row["reliable"] for row in results if row not in skipped):
+        print(
+            f"\n* PQ was trained on {results[0]['train_vectors']} chunks; below {PQ_MIN_RELIABLE_TRAINING} "
+            f"(39 x {2 ** PQ_NBITS}) its codebook overfits and the recall figure is unreliable."
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+# core.py
+
+import time
+import warnings
+
+import faiss
+import numpy as np
+from pypdf import PdfReader
+from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_community.embeddings import HuggingFaceEmbeddings
+from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+# --- Configuration ---
+EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+CHUNK_SIZE = 1000
+CHUNK_OVERLAP = 150
+
+# Supported FAISS index types:
+#   "flat" - exact search over float32 vectors (4 bytes per dimension)
+#   "sq8"  - int8 scalar quantization (1 byte per dimension, ~4x smaller)
+#   "pq"   - product quantization (pq_m bytes per vector, ~8x smaller by default).
+#            The codebook (2**PQ_NBITS x dim floats, ~393 KB at dim=384) is a fixed
+#            cost on top of that, so the ratio only approaches 8x on large corpora.
+INDEX_TYPES = ("flat", "sq8", "pq")
+PQ_NBITS = 8  # bits per PQ sub-quantizer code -> 256 centroids per sub-space
+# FAISS k-means wants ~39 training points per centroid; below this PQ codebooks
+# overfit the training set and measured recall is unreliable.
+PQ_MIN_RELIABLE_TRAINING = 39 * 2 ** PQ_NBITS
+
+
+def load_document_text(uploaded_file) -> str:
+    """Extract raw text from an uploaded PDF or TXT file."""
+    if uploaded_file.name.lower().endswith(".pdf"):
+        reader = PdfReader(uploaded_file)
+        return "\n".join(page.extract_text() or "" for page in reader.pages).strip()
+
+    content = uploaded_file.read()
+    if isinstance(content, bytes):
+        content = content.decode("utf-8")
+    return content.strip()
+
+
+def split_text(text: str) -> list:
+    """Split document text into overlapping chunks for retrieval."""
+    splitter = RecursiveCharacterTextSplitter(chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP)
+    return splitter.split_text(text)
+
+
+def get_embeddings():
+    """Return the sentence-transformers embedding model used for the vector store."""
+    return HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL_NAME)
+
+
+def effective_index_type(index_type: str, n_vectors: int) -> str:
+    """
+    Return the index type actually built for `n_vectors` vectors.
+
+    Product quantization needs at least 2**PQ_NBITS training vectors, so smaller
+    corpora fall back to int8 scalar quantization.
+    """
+    if index_type not in INDEX_TYPES:
+        raise ValueError(f"Unknown index_type '{index_type}'. Choose one of {INDEX_TYPES}.")
+    if index_type == "pq" and n_vectors < 2 ** PQ_NBITS:
+        return "sq8"
+    return index_type
+
+
+def build_faiss_index(vectors: np.ndarray, index_type: str = "flat", pq_m: int = None):
+    """
+    Build and train a FAISS index of the requested type over `vectors`.
+
+    Quantized indexes are trained on the vectors they will hold. A "pq" request
+    on fewer than 2**PQ_NBITS vectors builds an "sq8" index instead and warns.
+    """
+    vectors = np.ascontiguousarray(vectors, dtype="float32")
+    dim = vectors.shape[1]
+
+    built_type = effective_index_type(index_type, len(vectors))
+    if built_type != index_type:
+        warnings.warn(
+            f"index_type='{index_type}' needs at least {2 ** PQ_NBITS} vectors to train, "
+            f"got {len(vectors)}; building a '{built_type}' index instead.",
+            RuntimeWarning,
+        )
+    index_type = built_type
+
+    if index_type == "flat":
+        index = faiss.IndexFlatL2(dim)
+    elif index_type == "sq8":
+        index = faiss.IndexScalarQuantizer(dim, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_L2)
+    else:
+        pq_m = pq_m or dim // 2
+        if dim % pq_m != 0:
+            raise ValueError(f"pq_m={pq_m} must divide the embedding dimension {dim}.")
+        index = faiss.IndexPQ(dim, pq_m, PQ_NBITS, faiss.METRIC_L2)
+
+    if not index.is_trained:
+        index.train(vectors)
+    index.add(vectors)
+    return index
+
+
+def index_memory_bytes(index) -> int:
+    """Return the serialized size of a FAISS index in bytes."""
+    return faiss.serialize_index(index).nbytes
+
+
+def create_vector_store_from_texts(texts: list, embeddings=None, index_type: str = "flat", pq_m: int = None):
+    """Embed text chunks and wrap a (optionally quantized) FAISS index in a LangChain vector store."""
+    embeddings = embeddings or get_embeddings()
+    vectors = np.array(embeddings.embed_documents(texts), dtype="float32")
+    index = build_faiss_index(vectors, index_type=index_type, pq_m=pq_m)
+
+    ids = [str(i) for i in range(len(texts))]
+    docstore = InMemoryDocstore({
+        doc_id: Document(page_content=text) for doc_id, text in zip(ids, texts)
+    })
+    return FAISS(
+        embedding_function=embeddings,
+        index=index,
+        docstore=docstore,
+        index_to_docstore_id=dict(enumerate(ids)),
+    )
+
+
+def create_vector_store_from_upload(uploaded_file, index_type: str = "flat", pq_m: int = None):
+    """
+    Build a FAISS vector store from an uploaded document.
+
+    Use index_type="sq8" or "pq" to hold several times more chunks in RAM at
+    a small recall cost; see benchmark_index_types() for the measured trade-off.
+    """
+    text = load_document_text(uploaded_file)
+    return create_vector_store_from_texts(split_text(text), index_type=index_type, pq_m=pq_m)
+
+
+def benchmark_index_types(texts: list, embeddings=None, k: int = 4, n_queries: int = 100, pq_m: int = None) -> list:
+    """
+    Compare recall@k, memory and query latency of each index type against the flat index.
+
+    A random sample of chunks (at most a fifth of the corpus) is held out as
+    queries; the indexes are trained on and hold only the remaining chunks, and
+    the exact flat-index neighbours are used as ground truth. Each row records
+    the requested "index_type", the "effective_index_type" actually built (since
+    "pq" falls back to "sq8" below 2**PQ_NBITS chunks), the number of
+    "train_vectors", and whether the result is "reliable" (PQ needs
+    PQ_MIN_RELIABLE_TRAINING training vectors for a trustworthy recall figure).
+    """
+    embeddings = embeddings or get_embeddings()
+    vectors = np.array(embeddings.embed_documents(texts), dtype="float32")
+    if len(vectors) < 2:
+        raise ValueError("Need at least 2 chunks to hold out queries for the benchmark.")
+
+    rng = np.random.default_rng(0)
+    order = rng.permutation(len(vectors))
+    n_held_out = max(1, min(n_queries, len(vectors) // 5))
+    queries = vectors[order[:n_held_out]]
+    corpus = vectors[order[n_held_out:]]
+    k = min(k, len(corpus))
+
+    results = []
+    ground_truth = None
+    for index_type in INDEX_TYPES:
+        built_type = effective_index_type(index_type, len(corpus))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            index = build_faiss_index(corpus, index_type=index_type, pq_m=pq_m)
+
+        start = time.perf_counter()
+        _, neighbours = index.search(queries, k)
+        elapsed_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+        if ground_truth is None:
+            ground_truth = neighbours
+        recall = np.mean([
+            len(set(found) & set(expected)) / k
+            for found, expected in zip(neighbours, ground_truth)
+        ])
+
+        memory = index_memory_bytes(index)
+        results.append({
+            "index_type": index_type,
+            "effective_index_type": built_type,
+            "train_vectors": len(corpus),
+            "query_vectors": len(queries),
+            "reliable": built_type != "pq" or len(corpus) >= PQ_MIN_RELIABLE_TRAINING,
+            "recall_at_k": float(recall),
+            "memory_bytes": memory,
+            "bytes_per_vector": memory / len(corpus),
+            "query_ms": elapsed_ms,
+        })
+
+    flat_memory = results[0]["memory_bytes"]
+    for row in results:
+        row["compression"] = flat_memory / row["memory_bytes"]
+    return results